@@ -4,14 +4,44 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import datetime
+import fcntl
 import json
 import os
 import shlex
+import socket
 import subprocess
 import sys
-import textwrap
+import tempfile
+import time
+import urllib.request
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import websocket  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    websocket = None  # type: ignore[assignment]
+
+try:
+    import orjson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(data: Any) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # except clauses cover both parsers.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -42,6 +72,21 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Navigate to the most recent conversation fork before focusing the reply box",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch a fresh tab list instead of reusing a recent one",
+    )
+    parser.add_argument(
+        "--legacy-connect",
+        action="store_true",
+        help="Register the session via 'cdp connect' instead of writing the store directly",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in-process instead of delegating to the resident daemon",
+    )
     return parser.parse_args()
 
 
@@ -57,173 +102,432 @@ def env_port_default() -> int:
     return 9222
 
 
+DEBUG = os.getenv("REPLY_HNT_WEB_DEBUG", "") not in ("", "0")
+
+
+def _capture_stderr() -> Optional[int]:
+    # Only wire up a stderr pipe when someone will actually read it.
+    return subprocess.PIPE if DEBUG else subprocess.DEVNULL
+
+
+def _raise_cdp_failure(cmd: List[str], returncode: int, stderr: Optional[str]) -> None:
+    quoted = " ".join(shlex.quote(part) for part in cmd)
+    message = f"Command {quoted} failed with exit code {returncode}."
+    if stderr:
+        message = f"{message} {stderr.strip()}"
+    raise SystemExit(message)
+
+
 def run_cdp(cmd: List[str], capture: bool = False) -> str:
-    kwargs = {"text": True}
-    if capture:
-        kwargs["capture_output"] = True
-    process = subprocess.run(cmd, check=False, **kwargs)
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE if capture else None,
+        stderr=_capture_stderr() if capture else None,
+        text=True,
+    )
+    stdout, stderr = process.communicate()
     if process.returncode != 0:
-        stderr = process.stderr if capture else ""
-        quoted = " ".join(shlex.quote(part) for part in cmd)
-        message = f"Command {quoted} failed with exit code {process.returncode}."
-        if stderr:
-            message = f"{message} {stderr.strip()}"
-        raise SystemExit(message)
-    if capture:
-        assert process.stdout is not None
-        return process.stdout
-    return ""
+        _raise_cdp_failure(cmd, process.returncode, stderr)
+    return stdout or ""
 
 
-def list_tabs(host: str, port: int) -> List[Dict[str, Any]]:
-    output = run_cdp(
-        [
-            "cdp",
-            "tabs",
-            "list",
-            "--host",
-            host,
-            "--port",
-            str(port),
-            "--pretty=false",
-        ],
-        capture=True,
+def run_cdp_json(cmd: List[str]) -> Any:
+    """Run a cdp command and parse its stdout as JSON."""
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=_capture_stderr(),
+        text=True,
+    )
+    # communicate() drains both pipes concurrently; reading them one after
+    # the other can deadlock once the child fills the stderr pipe.
+    stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        _raise_cdp_failure(cmd, process.returncode, stderr)
+    return json_loads(stdout)
+
+
+class CdpClient:
+    """One persistent DevTools WebSocket shared by every step of a run."""
+
+    def __init__(self, ws_url: str) -> None:
+        if websocket is None:
+            raise RuntimeError("websocket-client is not installed")
+        self._conn = websocket.create_connection(ws_url, timeout=5)
+        self._next_id = 0
+
+    def _send(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        self._next_id += 1
+        message: Dict[str, Any] = {"id": self._next_id, "method": method}
+        if params:
+            message["params"] = params
+        try:
+            self._conn.send(json_dumps(message))
+            while True:
+                reply = json_loads(self._conn.recv())
+                if reply.get("id") != self._next_id:
+                    continue  # interleaved CDP event; not ours
+                if "error" in reply:
+                    return {}, reply["error"]
+                return reply.get("result", {}), None
+        except (OSError, websocket.WebSocketException) as exc:
+            # Surface transport failures the same way the subprocess path
+            # does, so run_with_retry can clear caches and go again.
+            raise SystemExit(f"CDP {method} failed: WebSocket error: {exc}") from exc
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        result, error = self._send(method, params)
+        if error is not None:
+            raise SystemExit(f"CDP {method} failed: {error.get('message', error)}")
+        return result
+
+    def evaluate(self, expression: str) -> Any:
+        result = self.send(
+            "Runtime.evaluate",
+            {"expression": expression, "returnByValue": True},
+        )
+        exception = result.get("exceptionDetails")
+        if exception:
+            raise SystemExit(f"CDP Runtime.evaluate threw: {exception.get('text', exception)}")
+        return result.get("result", {}).get("value")
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+
+def connect_client(tab: Dict[str, Any]) -> Optional[CdpClient]:
+    if websocket is None:
+        return None
+    ws_url = tab.get("webSocketDebuggerUrl")
+    if not ws_url:
+        return None
+    try:
+        return CdpClient(ws_url)
+    except Exception as exc:
+        print(f"Warning: direct CDP connection failed ({exc}); using cdp CLI.", file=sys.stderr)
+        return None
+
+
+TAB_CACHE_TTL_SECONDS = 2.0
+RUN_STATE_TTL_SECONDS = 30.0
+
+
+def run_state_path() -> str:
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "cdp-cli", "reply-hnt-web.json")
+
+
+def read_run_state() -> Optional[Dict[str, Any]]:
+    path = run_state_path()
+    try:
+        if time.time() - os.stat(path).st_mtime > RUN_STATE_TTL_SECONDS:
+            return None
+        with open(path, encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def matches_run_state(tab_id: str, url: str, session: str) -> bool:
+    state = read_run_state()
+    if state is None:
+        return False
+    return (
+        state.get("tab_id") == tab_id
+        and state.get("url") == url
+        and state.get("session") == session
     )
+
+
+def write_run_state(tab_id: str, url: str, session: str) -> None:
+    path = run_state_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"tab_id": tab_id, "url": url, "session": session}, handle)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def clear_run_state() -> bool:
+    try:
+        os.unlink(run_state_path())
+    except OSError:
+        return False
+    return True
+
+
+def tab_cache_path(host: str, port: int) -> str:
+    return os.path.join(tempfile.gettempdir(), f"cdp-cli-tabs-{host}-{port}.json")
+
+
+def read_cached_tabs(host: str, port: int) -> Optional[List[Dict[str, Any]]]:
+    path = tab_cache_path(host, port)
     try:
-        return json.loads(output)
+        if time.time() - os.stat(path).st_mtime > TAB_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "rb") as handle:
+            tabs = json_loads(handle.read())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return tabs if isinstance(tabs, list) and tabs else None
+
+
+def write_tab_cache(host: str, port: int, tabs: List[Dict[str, Any]]) -> None:
+    path = tab_cache_path(host, port)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(json_dumps(tabs))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def invalidate_tab_cache(host: str, port: int) -> None:
+    try:
+        os.unlink(tab_cache_path(host, port))
+    except OSError:
+        pass
+
+
+def list_tabs(host: str, port: int) -> List[Dict[str, Any]]:
+    url = f"http://{host}:{port}/json"
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            output = response.read()
+    except OSError as exc:
+        raise SystemExit(f"Unable to reach DevTools at {url}: {exc}") from exc
+    try:
+        return json_loads(output)
     except json.JSONDecodeError as exc:
-        raise SystemExit(f"Unable to parse cdp tabs list output as JSON: {exc}") from exc
+        raise SystemExit(f"Unable to parse DevTools /json output: {exc}") from exc
 
 
-def find_tab(tabs: List[Dict[str, Any]], key: str) -> Dict[str, Any]:
+def find_tab(
+    tabs: List[Dict[str, Any]], key: str, hinted_id: Optional[str] = None
+) -> Dict[str, Any]:
     needle = key.lower()
+    if hinted_id:
+        hinted = next((tab for tab in tabs if tab.get("id") == hinted_id), None)
+        if hinted is not None and needle in (hinted.get("title") or "").lower():
+            return hinted
     for tab in tabs:
         title = (tab.get("title") or "").lower()
         if needle in title:
             return tab
+    # Only pay for the full title join on the failure path.
     available = ", ".join(tab.get("title") or "<untitled>" for tab in tabs)
     raise SystemExit(f"No tab title contains {key!r}. Available titles: {available}")
 
 
-def switch_tab(tab_id: str, host: str, port: int) -> None:
-    run_cdp(
-        [
-            "cdp",
-            "tabs",
-            "switch",
-            "--host",
-            host,
-            "--port",
-            str(port),
-            tab_id,
-        ]
-    )
+def switch_tab(client: Optional[CdpClient], tab_id: str, host: str, port: int) -> None:
+    if client is not None:
+        client.send("Target.activateTarget", {"targetId": tab_id})
+        return
+    url = f"http://{host}:{port}/json/activate/{tab_id}"
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            response.read()
+    except OSError as exc:
+        raise SystemExit(f"Unable to activate tab via {url}: {exc}") from exc
 
 
-def connect_session(session: str, target_url: str, host: str, port: int) -> None:
-    run_cdp(
-        [
-            "cdp",
-            "connect",
-            "--session",
-            session,
-            "--host",
-            host,
-            "--port",
-            str(port),
-            "--url",
-            target_url,
-        ]
-    )
+def session_store_path() -> str:
+    config_home = os.getenv("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(config_home, "cdp-cli", "sessions.json")
 
 
-def focus_reply(session: str) -> None:
-    script = textwrap.dedent(
-        """
-        (() => {
-          try {
-            window.scrollTo(0, document.documentElement.scrollHeight || document.body.scrollHeight || 0);
-          } catch (err) {}
-          const el = document.querySelector('textarea#new-message-content');
-          if (el) {
-            el.focus();
-            if (typeof el.setSelectionRange === 'function') {
-              const pos = el.value.length;
-              el.setSelectionRange(pos, pos);
-            }
-          }
-        })()
-        """
-    ).strip()
-    run_cdp(["cdp", "eval", "--session", session, script])
-
-
-def maybe_switch_to_most_recent_fork(session: str) -> Tuple[bool, Optional[str]]:
-    script = textwrap.dedent(
-        """
-        (() => {
-          const response = {
-            action: "focus",
-            reason: "default",
-            targetForkId: null,
-            currentConversationId: null,
-          };
-          try {
-            const convo = globalThis.__HINATA_ACTIVE_CONVERSATION;
-            if (!convo || !Array.isArray(convo.forks) || convo.forks.length === 0) {
-              response.reason = "no-forks";
-              return response;
-            }
-            const forks = convo.forks.filter(
-              (fork) => typeof fork === "string" && fork.trim() !== ""
-            );
-            if (forks.length === 0) {
-              response.reason = "no-valid-forks";
-              return response;
-            }
-            const latest = forks[forks.length - 1];
-            response.targetForkId = latest;
-            const pathname =
-              globalThis.location && typeof globalThis.location.pathname === "string"
-                ? globalThis.location.pathname
-                : "";
-            const match = pathname.match(/\\/c\\/([^/]+)/);
-            const current = match ? match[1] : "";
-            response.currentConversationId = current || null;
-            if (latest && current && latest !== current) {
-              const url = new URL(globalThis.location.href);
-              const segments = url.pathname.split("/");
-              const idx = segments.indexOf("c");
-              if (idx >= 0 && idx + 1 < segments.length) {
-                segments[idx + 1] = latest;
-                url.pathname = segments.join("/");
-              } else {
-                url.pathname = `/c/${latest}`;
-              }
-              response.action = "navigated";
-              response.reason = "navigated-to-fork";
-              globalThis.location.assign(url.toString());
-            } else {
-              response.reason = latest ? "already-on-fork" : "missing-latest";
-            }
-            return response;
-          } catch (err) {
-            response.reason = "error";
-            response.error = err && err.message ? err.message : String(err);
-            return response;
-          }
-        })()
-        """
-    ).strip()
-    output = run_cdp(["cdp", "eval", "--session", session, script], capture=True).strip()
-    try:
-        payload = json.loads(output)
-    except json.JSONDecodeError as exc:
-        print(
-            f"Warning: unable to parse CDP eval output for fork navigation: {exc}",
-            file=sys.stderr,
+def connect_session(
+    session: str, tab: Dict[str, Any], host: str, port: int, legacy: bool = False
+) -> None:
+    if legacy:
+        run_cdp(
+            [
+                "cdp",
+                "connect",
+                "--session",
+                session,
+                "--host",
+                host,
+                "--port",
+                str(port),
+                "--url",
+                tab.get("url") or "",
+            ]
         )
-        return True, None
+        return
+    # Write the entry the cdp CLI would, straight into its session store
+    # (see internal/store), skipping the subprocess round-trip.
+    entry = {
+        "name": session,
+        "host": host,
+        "port": port,
+        "url": tab.get("url") or "",
+        "targetId": tab.get("id") or "",
+        "webSocketUrl": tab.get("webSocketDebuggerUrl") or "",
+        "title": tab.get("title") or "",
+        "type": tab.get("type") or "page",
+        "lastConnected": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "lastTargetInfo": tab.get("description") or "",
+    }
+    path = session_store_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        lock = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            raw = os.read(lock, 1 << 22)
+            try:
+                store = json.loads(raw) if raw.strip() else {}
+            except json.JSONDecodeError:
+                store = {}
+            if not isinstance(store, dict):
+                store = {}
+            sessions = store.get("sessions")
+            if not isinstance(sessions, dict):
+                sessions = {}
+            sessions[session] = entry
+            store["sessions"] = sessions
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(store, handle, indent=2)
+            os.replace(tmp_path, path)
+        finally:
+            os.close(lock)
+    except OSError as exc:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise SystemExit(f"Unable to update session store at {path}: {exc}") from exc
+
+
+# JS payloads are kept pre-dedented at module level so no per-call
+# textwrap/strip pass is needed before shipping them to the tab.
+_FOCUS_JS = """\
+(() => {
+  try {
+    window.scrollTo(0, document.documentElement.scrollHeight || document.body.scrollHeight || 0);
+  } catch (err) {}
+  const el = document.querySelector('textarea#new-message-content');
+  if (el) {
+    el.focus();
+    if (typeof el.setSelectionRange === 'function') {
+      const pos = el.value.length;
+      el.setSelectionRange(pos, pos);
+    }
+  }
+})()"""
+
+_FORK_JS = """\
+(() => {
+  const response = {
+    action: "focus",
+    reason: "default",
+    focused: false,
+    targetForkId: null,
+    currentConversationId: null,
+  };
+  const focusReply = () => {
+    try {
+      window.scrollTo(0, document.documentElement.scrollHeight || document.body.scrollHeight || 0);
+    } catch (err) {}
+    const el = document.querySelector('textarea#new-message-content');
+    if (el) {
+      el.focus();
+      if (typeof el.setSelectionRange === 'function') {
+        const pos = el.value.length;
+        el.setSelectionRange(pos, pos);
+      }
+    }
+    response.focused = true;
+  };
+  try {
+    const convo = globalThis.__HINATA_ACTIVE_CONVERSATION;
+    if (!convo || !Array.isArray(convo.forks) || convo.forks.length === 0) {
+      response.reason = "no-forks";
+      focusReply();
+      return response;
+    }
+    const forks = convo.forks.filter(
+      (fork) => typeof fork === "string" && fork.trim() !== ""
+    );
+    if (forks.length === 0) {
+      response.reason = "no-valid-forks";
+      focusReply();
+      return response;
+    }
+    const latest = forks[forks.length - 1];
+    response.targetForkId = latest;
+    const pathname =
+      globalThis.location && typeof globalThis.location.pathname === "string"
+        ? globalThis.location.pathname
+        : "";
+    const match = pathname.match(/\\/c\\/([^/]+)/);
+    const current = match ? match[1] : "";
+    response.currentConversationId = current || null;
+    if (latest && current && latest !== current) {
+      const url = new URL(globalThis.location.href);
+      const segments = url.pathname.split("/");
+      const idx = segments.indexOf("c");
+      if (idx >= 0 && idx + 1 < segments.length) {
+        segments[idx + 1] = latest;
+        url.pathname = segments.join("/");
+      } else {
+        url.pathname = `/c/${latest}`;
+      }
+      response.action = "navigated";
+      response.reason = "navigated-to-fork";
+      globalThis.location.assign(url.toString());
+    } else {
+      response.reason = latest ? "already-on-fork" : "missing-latest";
+      focusReply();
+    }
+    return response;
+  } catch (err) {
+    response.reason = "error";
+    response.error = err && err.message ? err.message : String(err);
+    return response;
+  }
+})()"""
+
+
+def focus_reply(client: Optional[CdpClient], session: str) -> None:
+    if client is not None:
+        client.evaluate(_FOCUS_JS)
+        return
+    run_cdp(["cdp", "eval", "--session", session, _FOCUS_JS])
+
+
+def maybe_switch_to_most_recent_fork(
+    client: Optional[CdpClient], session: str
+) -> Tuple[bool, Optional[str]]:
+    if client is not None:
+        payload = client.evaluate(_FORK_JS)
+    else:
+        try:
+            payload = run_cdp_json(["cdp", "eval", "--session", session, _FORK_JS])
+        except json.JSONDecodeError as exc:
+            print(
+                f"Warning: unable to parse CDP eval output for fork navigation: {exc}",
+                file=sys.stderr,
+            )
+            return True, None
     if not isinstance(payload, dict):
         return True, None
     if payload.get("reason") == "error" and payload.get("error"):
@@ -234,32 +538,156 @@ def maybe_switch_to_most_recent_fork(session: str) -> Tuple[bool, Optional[str]]
     if payload.get("action") == "navigated":
         target = payload.get("targetForkId") or payload.get("currentConversationId") or "latest fork"
         return False, f"Tab activated and navigated to fork {target}."
+    if payload.get("focused"):
+        return False, "Tab activated and textarea focused."
     return True, None
 
 
-def main() -> None:
-    args = parse_args()
+def resolve_tab(args: argparse.Namespace) -> Dict[str, Any]:
+    use_cache = not args.no_cache
+    state = read_run_state()
+    hinted_id = state.get("tab_id") if state and state.get("session") == args.session else None
+    if use_cache:
+        cached = read_cached_tabs(args.host, args.port)
+        if cached is not None:
+            try:
+                return find_tab(cached, args.tab_key, hinted_id)
+            except SystemExit:
+                invalidate_tab_cache(args.host, args.port)
     tabs = list_tabs(args.host, args.port)
     if not tabs:
         raise SystemExit("No discoverable tabs. Is Chrome running with --remote-debugging-port?")
-    tab = find_tab(tabs, args.tab_key)
+    if use_cache:
+        write_tab_cache(args.host, args.port, tabs)
+    return find_tab(tabs, args.tab_key, hinted_id)
+
+
+def run(args: argparse.Namespace, allow_warm_start: bool) -> str:
+    tab = resolve_tab(args)
     tab_id = tab.get("id")
     if not tab_id:
         raise SystemExit("Selected tab has no ID; cannot continue.")
-    switch_tab(tab_id, args.host, args.port)
     target_url = tab.get("url")
     if not target_url:
         raise SystemExit("Selected tab has no URL; cannot connect.")
-    connect_session(args.session, target_url, args.host, args.port)
-    should_focus = True
-    status_message: Optional[str] = None
-    if args.most_recent_fork:
-        should_focus, status_message = maybe_switch_to_most_recent_fork(args.session)
-    if should_focus:
-        focus_reply(args.session)
-        print(status_message or "Tab activated and textarea focused.")
-    else:
-        print(status_message or "Tab activated and navigated to the latest fork.")
+    warm = (
+        allow_warm_start
+        and tab.get("type", "page") == "page"
+        and matches_run_state(tab_id, target_url, args.session)
+    )
+    client = connect_client(tab)
+    try:
+        # The run state can't prove the tab is still frontmost (/json has no
+        # focused field), so always activate; it's one cheap round-trip on
+        # the WebSocket we already hold. Warm runs only skip re-registering
+        # the session.
+        if warm:
+            switch_tab(client, tab_id, args.host, args.port)
+        else:
+            # Tab activation and session registration travel over separate
+            # channels (WebSocket/HTTP vs the session store), so overlap them.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+                switch_future = pool.submit(switch_tab, client, tab_id, args.host, args.port)
+                connect_future = pool.submit(
+                    connect_session,
+                    args.session,
+                    tab,
+                    args.host,
+                    args.port,
+                    args.legacy_connect,
+                )
+                switch_future.result()
+                connect_future.result()
+        should_focus = True
+        status_message: Optional[str] = None
+        if args.most_recent_fork:
+            should_focus, status_message = maybe_switch_to_most_recent_fork(client, args.session)
+        if should_focus:
+            focus_reply(client, args.session)
+            status_message = status_message or "Tab activated and textarea focused."
+        else:
+            status_message = status_message or "Tab activated and navigated to the latest fork."
+        write_run_state(tab_id, target_url, args.session)
+        return status_message
+    finally:
+        if client is not None:
+            client.close()
+
+
+def run_with_retry(args: argparse.Namespace) -> str:
+    try:
+        return run(args, allow_warm_start=True)
+    except SystemExit as exc:
+        if exc.code in (None, 0) or not clear_run_state():
+            raise
+        invalidate_tab_cache(args.host, args.port)
+        return run(args, allow_warm_start=False)
+
+
+def daemon_socket_path() -> str:
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, "cdp-cli-hnt.sock")
+
+
+def try_daemon(args: argparse.Namespace) -> Optional[str]:
+    """Hand the run to the resident daemon; None means it is unavailable."""
+    sock_path = daemon_socket_path()
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(10)
+        sock.connect(sock_path)
+    except OSError:
+        spawn_daemon()
+        return None
+    # Past this point the daemon may already be executing the run, so a
+    # lost or garbled reply must not trigger an in-process rerun racing it.
+    try:
+        sock.sendall(json_dumps(vars(args)).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+        reply = json_loads(b"".join(chunks))
+    except OSError as exc:
+        raise SystemExit(f"Lost contact with the daemon mid-run: {exc}") from exc
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Unable to parse the daemon's reply: {exc}") from exc
+    finally:
+        sock.close()
+    if not isinstance(reply, dict):
+        raise SystemExit("Daemon sent a malformed reply.")
+    if not reply.get("ok"):
+        raise SystemExit(reply.get("error") or "Daemon reported an unknown failure.")
+    return reply.get("message") or ""
+
+
+def spawn_daemon() -> None:
+    daemon_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reply_hnt_web_daemon.py")
+    if not os.path.exists(daemon_script):
+        return
+    try:
+        subprocess.Popen(
+            [sys.executable, daemon_script],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.no_daemon:
+        message = try_daemon(args)
+        if message is not None:
+            print(message)
+            return
+    print(run_with_retry(args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Resident daemon that serves reply_hnt_web runs over a Unix socket."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import reply_hnt_web  # noqa: E402
+
+
+def serve_client(conn: socket.socket) -> None:
+    conn.settimeout(30)
+    try:
+        chunks = []
+        while True:
+            chunk = conn.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+        raw = b"".join(chunks)
+        if not raw.strip():
+            return
+        try:
+            payload = reply_hnt_web.json_loads(raw)
+        except json.JSONDecodeError as exc:
+            reply = {"ok": False, "error": f"Bad request: {exc}"}
+        else:
+            reply = handle_request(payload)
+        conn.sendall(reply_hnt_web.json_dumps(reply).encode("utf-8") + b"\n")
+    except OSError:
+        pass
+    finally:
+        conn.close()
+
+
+def handle_request(payload: object) -> dict:
+    if not isinstance(payload, dict):
+        return {"ok": False, "error": "Bad request: expected a JSON object."}
+    args = argparse.Namespace(**payload)
+    try:
+        message = reply_hnt_web.run_with_retry(args)
+    except SystemExit as exc:
+        return {"ok": False, "error": str(exc.code) if exc.code else "Run failed."}
+    except Exception as exc:  # keep the daemon alive across bad runs
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    return {"ok": True, "message": message}
+
+
+def main() -> None:
+    sock_path = reply_hnt_web.daemon_socket_path()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(sock_path)
+    except OSError:
+        # A stale socket file (or a dead daemon) blocks the bind; probe it
+        # and take the address over only if nothing answers.
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(sock_path)
+        except OSError:
+            probe.close()
+            try:
+                os.unlink(sock_path)
+            except OSError:
+                pass
+            server.bind(sock_path)
+        else:
+            probe.close()
+            return  # another daemon is already serving
+    os.chmod(sock_path, 0o600)
+    server.listen(4)
+    try:
+        while True:
+            conn, _ = server.accept()
+            serve_client(conn)
+    finally:
+        server.close()
+        try:
+            os.unlink(sock_path)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    main()